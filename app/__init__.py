@@ -5,10 +5,14 @@ Core application modules for tax calculation and recommendation.
 
 __all__ = [
     "app",
+    "api",
+    "async_app",
     "auth",
     "calculator",
     "recommender",
     "database",
     "exports",
+    "passwords",
+    "formatting",
     "ui_components",
 ]
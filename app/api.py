@@ -0,0 +1,118 @@
+"""
+Request handling shared by the Flask (wsgi.py) and async (asgi.py) entry points.
+The entry points only decide where work runs; parsing, validation, error
+messages and response shapes live here so the two cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.calculator import TaxInputs
+from app.exports import comparison_rows, report_summary
+from app.recommender import compare_regimes, generate_suggestions
+
+REGIMES = ("Old Regime", "New Regime")
+EXPORT_MIMETYPES = {"csv": "text/csv", "pdf": "application/pdf"}
+HISTORY_COLUMNS = ("date", "regime", "income", "tax")
+DEFAULT_HISTORY_LIMIT = 10
+MAX_HISTORY_LIMIT = 100
+MAX_PASSWORD_BYTES = 72  # bcrypt only hashes the first 72 bytes; bcrypt>=5 rejects longer input
+
+USERNAME_TAKEN = "username already exists"
+INVALID_CREDENTIALS = "invalid credentials"
+
+
+class ApiError(Exception):
+	"""Client error carrying the HTTP status it should be reported with."""
+
+	def __init__(self, message: str, status: int = 400) -> None:
+		super().__init__(message)
+		self.status = status
+
+
+class HistoryEntry(NamedTuple):
+	regime: str
+	income: float
+	deductions_old: float
+	tax: float
+
+
+def parse_body(raw: bytes) -> Dict[str, Any]:
+	"""Decode a request body; an empty body is an empty object."""
+	if not raw.strip():
+		return {}
+	try:
+		payload = json.loads(raw)
+	except ValueError:
+		raise ApiError("request body must be valid JSON")
+	if not isinstance(payload, dict):
+		raise ApiError("request body must be a JSON object")
+	return payload
+
+
+def credentials(payload: Dict[str, Any]) -> Tuple[str, str]:
+	username = str(payload.get("username") or "").strip()
+	password = str(payload.get("password") or "")
+	if not username or not password:
+		raise ApiError("username and password are required")
+	if len(password.encode("utf-8")) > MAX_PASSWORD_BYTES:
+		raise ApiError(f"password cannot be longer than {MAX_PASSWORD_BYTES} bytes")
+	return username, password
+
+
+def require_user(username: Optional[str]) -> str:
+	if not username:
+		raise ApiError("authentication required", 401)
+	return username
+
+
+def tax_inputs(payload: Dict[str, Any]) -> TaxInputs:
+	try:
+		return TaxInputs.from_mapping(payload)
+	except (TypeError, ValueError):
+		raise ApiError("invalid tax inputs")
+
+
+def compare_result(payload: Dict[str, Any]) -> Dict[str, Any]:
+	inputs = tax_inputs(payload)
+	preferred, old_res, new_res = compare_regimes(inputs)
+	return {
+		"preferred": preferred,
+		"old": old_res,
+		"new": new_res,
+		"suggestions": generate_suggestions(inputs, old_res["tax"], new_res["tax"]),
+	}
+
+
+def history_entry(payload: Dict[str, Any]) -> HistoryEntry:
+	inputs = tax_inputs(payload)
+	preferred, old_res, new_res = compare_regimes(inputs)
+	regime = payload.get("regime") or preferred
+	if regime not in REGIMES:
+		raise ApiError("regime must be 'Old Regime' or 'New Regime'")
+	res = old_res if regime == "Old Regime" else new_res
+	return HistoryEntry(regime, inputs.annual_income, inputs.total_deductions_old, res["tax"])
+
+
+def history_limit(raw: Optional[str]) -> int:
+	"""Parse ?limit=; anything missing, malformed or outside 1..MAX_HISTORY_LIMIT gets the default."""
+	try:
+		limit = int(raw) if raw is not None else DEFAULT_HISTORY_LIMIT
+	except ValueError:
+		return DEFAULT_HISTORY_LIMIT
+	return limit if 1 <= limit <= MAX_HISTORY_LIMIT else DEFAULT_HISTORY_LIMIT
+
+
+def history_rows(recs: Sequence[Tuple]) -> List[Dict[str, Any]]:
+	return [dict(zip(HISTORY_COLUMNS, rec)) for rec in recs]
+
+
+def export_report(fmt: str, payload: Dict[str, Any]) -> Tuple[Dict[str, str], List[Dict]]:
+	"""Validate an export request and return the (summary, rows) to render."""
+	if fmt not in EXPORT_MIMETYPES:
+		raise ApiError("format must be csv or pdf", 404)
+	inputs = tax_inputs(payload)
+	preferred, old_res, new_res = compare_regimes(inputs)
+	return report_summary(preferred, inputs, old_res, new_res), comparison_rows(old_res, new_res)
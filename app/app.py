@@ -3,17 +3,22 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from typing import Dict
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify, render_template_string, session
 from flask_cors import CORS
 import pandas as pd
 import plotly.graph_objects as go
 
 from app.auth import is_authenticated, login, logout, signup, SESSION_USER_KEY
 from app.calculator import TaxInputs, calculate_old_regime, calculate_new_regime
-from app.database import ensure_dbs, save_history, get_recent_history
+from app.passwords import hash_password, check_password
+from app.database import ensure_dbs, create_user, get_user_hash, save_history, get_recent_history
 from app.recommender import compare_regimes, generate_suggestions
-from app.ui_components import gradient_header, metric_card, two_column_metrics, format_inr
-from app.exports import export_csv, export_pdf
+from app.ui_components import gradient_header, metric_card, two_column_metrics, format_inr, format_inr_array
+from app.exports import comparison_rows, report_summary, export_csv, export_pdf
+from app.api import (
+	ApiError, EXPORT_MIMETYPES, INVALID_CREDENTIALS, USERNAME_TAKEN,
+	parse_body, credentials, require_user, compare_result, history_entry, history_limit, history_rows, export_report,
+)
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -26,6 +31,57 @@ CORS(app, resources={r"/api/*": {"origins": "*"}})
 def ping():
     return jsonify({"message": "pong"})
 
+
+@app.errorhandler(ApiError)
+def _api_error(exc: ApiError):
+	return jsonify({"error": str(exc)}), exc.status
+
+
+def _json_body() -> Dict:
+	return parse_body(request.get_data(cache=True))
+
+
+@app.route("/api/signup", methods=["POST"])
+def api_signup():
+	username, password = credentials(_json_body())
+	if not create_user(username, hash_password(password)):
+		raise ApiError(USERNAME_TAKEN, 409)
+	return jsonify({"username": username}), 201
+
+
+@app.route("/api/login", methods=["POST"])
+def api_login():
+	username, password = credentials(_json_body())
+	saved_hash = get_user_hash(username)
+	if not saved_hash or not check_password(password, saved_hash):
+		raise ApiError(INVALID_CREDENTIALS, 401)
+	session[SESSION_USER_KEY] = username
+	return jsonify({"username": username})
+
+
+@app.route("/api/compare", methods=["POST"])
+def api_compare():
+	return jsonify(compare_result(_json_body()))
+
+
+@app.route("/api/history", methods=["GET", "POST"])
+def api_history():
+	username = require_user(session.get(SESSION_USER_KEY))
+	if request.method == "GET":
+		recs = get_recent_history(username, history_limit(request.args.get("limit")))
+		return jsonify(history_rows(recs))
+	entry = history_entry(_json_body())
+	save_history(username, *entry)
+	return jsonify({"regime": entry.regime, "tax": entry.tax}), 201
+
+
+@app.route("/api/export/<fmt>", methods=["POST"])
+def api_export(fmt: str):
+	summary, rows = export_report(fmt, _json_body())
+	if fmt == "csv":
+		return Response(export_csv(rows), mimetype=EXPORT_MIMETYPES[fmt])
+	return Response(export_pdf(summary, rows), mimetype=EXPORT_MIMETYPES[fmt])
+
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 LOGO_PATH = ASSETS_DIR / "savemax_logo.png"
 CUSTOM_CSS = ASSETS_DIR / "custom.css"
@@ -115,7 +171,7 @@ def _dashboard_ui(username: str) -> None:
 	if regime_choice == "Auto Compare":
 		cheaper = "Old Regime" if old_res["tax"] < new_res["tax"] else "New Regime"
 		delta = abs(old_res["tax"] - new_res["tax"])
-		st.success(f"💡 Save with SaveMax: {cheaper} saves ₹{delta:,.0f} compared to the other.")
+		st.success(f"💡 Save with SaveMax: {cheaper} saves {format_inr(delta, decimals=0)} compared to the other.")
 		_to_plot = {
 			"Old Regime": old_res["tax"],
 			"New Regime": new_res["tax"],
@@ -142,8 +198,8 @@ def _dashboard_ui(username: str) -> None:
 		recs = get_recent_history(username)
 		if recs:
 			df = pd.DataFrame(recs, columns=["date", "regime", "income", "tax"]) \
-				.assign(income=lambda d: d["income"].map(lambda v: f"₹{v:,.0f}")) \
-				.assign(tax=lambda d: d["tax"].map(lambda v: f"₹{v:,.0f}"))
+				.assign(income=lambda d: format_inr_array(d["income"], decimals=0)) \
+				.assign(tax=lambda d: format_inr_array(d["tax"], decimals=0))
 			st.dataframe(df, use_container_width=True, hide_index=True)
 			# Line chart (numeric)
 			df_num = pd.DataFrame(recs, columns=["date", "regime", "income", "tax"]).sort_values("date")
@@ -154,21 +210,11 @@ def _dashboard_ui(username: str) -> None:
 			st.caption("No history yet. Save a calculation to see it here.")
 
 	with tab2:
-		rows = [
-			{"Metric": "Gross Income", "Old": old_res["gross_income"], "New": new_res["gross_income"]},
-			{"Metric": "Taxable Income", "Old": old_res["taxable_income"], "New": new_res["taxable_income"]},
-			{"Metric": "Tax Payable", "Old": old_res["tax"], "New": new_res["tax"]},
-		]
+		rows = comparison_rows(old_res, new_res)
 		csv_bytes = export_csv(rows)
 		st.download_button("⬇️ Export CSV", csv_bytes, file_name="savemax_report.csv", mime="text/csv")
 
-		summary = {
-			"Preferred Regime": chosen_regime,
-			"Gross Income": f"₹{inputs.annual_income:,.0f}",
-			"Total Deductions (Old)": f"₹{inputs.total_deductions_old:,.0f}",
-			"Tax Old": f"₹{old_res['tax']:,.0f}",
-			"Tax New": f"₹{new_res['tax']:,.0f}",
-		}
+		summary = report_summary(chosen_regime, inputs, old_res, new_res)
 		pdf_bytes = export_pdf(summary, rows)
 		st.download_button("🧾 Export PDF", pdf_bytes, file_name="savemax_report.pdf", mime="application/pdf")
 
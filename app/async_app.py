@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.auth import SESSION_USER_KEY
+from app.passwords import hash_password, check_password
+from app.database import ensure_dbs, create_user, get_user_hash, save_history, get_recent_history
+from app.exports import export_csv, export_pdf
+from app.api import (
+	ApiError, EXPORT_MIMETYPES, INVALID_CREDENTIALS, USERNAME_TAKEN,
+	parse_body, credentials, require_user, compare_result, history_entry, history_limit, history_rows, export_report,
+)
+
+# bcrypt and PDF rendering run in worker processes so long CPU bursts stay out of the process running the
+# event loop and the server's own threads; SQLite calls are short I/O waits and only need a thread pool.
+# Both pools are per server process: `uvicorn --workers N` starts N * CPU_WORKERS spawned processes.
+CPU_WORKERS = int(os.environ.get("SAVEMAX_CPU_WORKERS", os.cpu_count() or 1))
+DB_THREADS = int(os.environ.get("SAVEMAX_DB_THREADS", 8))
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+	ensure_dbs()
+	# spawn rather than fork: the event loop and its threads are already running here
+	app.state.cpu_pool = ProcessPoolExecutor(max_workers=CPU_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+	app.state.db_pool = ThreadPoolExecutor(max_workers=DB_THREADS, thread_name_prefix="savemax-db")
+	try:
+		yield
+	finally:
+		app.state.cpu_pool.shutdown(wait=True, cancel_futures=True)
+		app.state.db_pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def _offload(pool: Executor, fn: Callable[..., Any], *args: Any) -> Any:
+	return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+
+async def _cpu(request: Request, fn: Callable[..., Any], *args: Any) -> Any:
+	return await _offload(request.app.state.cpu_pool, fn, *args)
+
+
+async def _db(request: Request, fn: Callable[..., Any], *args: Any) -> Any:
+	return await _offload(request.app.state.db_pool, fn, *args)
+
+
+async def _json_body(request: Request) -> Dict[str, Any]:
+	return parse_body(await request.body())
+
+
+async def _api_error(request: Request, exc: ApiError) -> JSONResponse:
+	return JSONResponse({"error": str(exc)}, status_code=exc.status)
+
+
+async def ping(request: Request) -> JSONResponse:
+	return JSONResponse({"message": "pong"})
+
+
+async def api_signup(request: Request) -> JSONResponse:
+	username, password = credentials(await _json_body(request))
+	password_hash = await _cpu(request, hash_password, password)
+	if not await _db(request, create_user, username, password_hash):
+		raise ApiError(USERNAME_TAKEN, 409)
+	return JSONResponse({"username": username}, status_code=201)
+
+
+async def api_login(request: Request) -> JSONResponse:
+	username, password = credentials(await _json_body(request))
+	saved_hash = await _db(request, get_user_hash, username)
+	if not saved_hash or not await _cpu(request, check_password, password, saved_hash):
+		raise ApiError(INVALID_CREDENTIALS, 401)
+	request.session[SESSION_USER_KEY] = username
+	return JSONResponse({"username": username})
+
+
+async def api_compare(request: Request) -> JSONResponse:
+	# Pure arithmetic in microseconds: cheaper to run on the loop than to hand off
+	return JSONResponse(compare_result(await _json_body(request)))
+
+
+async def api_history(request: Request) -> JSONResponse:
+	username = require_user(request.session.get(SESSION_USER_KEY))
+	if request.method == "GET":
+		recs = await _db(request, get_recent_history, username, history_limit(request.query_params.get("limit")))
+		return JSONResponse(history_rows(recs))
+	entry = history_entry(await _json_body(request))
+	await _db(request, save_history, username, *entry)
+	return JSONResponse({"regime": entry.regime, "tax": entry.tax}, status_code=201)
+
+
+async def api_export(request: Request) -> Response:
+	fmt = request.path_params["fmt"]
+	summary, rows = export_report(fmt, await _json_body(request))
+	if fmt == "csv":
+		return Response(export_csv(rows), media_type=EXPORT_MIMETYPES[fmt])
+	pdf_bytes = await _cpu(request, export_pdf, summary, rows)
+	return Response(pdf_bytes, media_type=EXPORT_MIMETYPES[fmt])
+
+
+app = Starlette(
+	routes=[
+		Route("/api/ping", ping),
+		Route("/api/signup", api_signup, methods=["POST"]),
+		Route("/api/login", api_login, methods=["POST"]),
+		Route("/api/compare", api_compare, methods=["POST"]),
+		Route("/api/history", api_history, methods=["GET", "POST"]),
+		Route("/api/export/{fmt}", api_export, methods=["POST"]),
+	],
+	middleware=[
+		Middleware(CORSMiddleware, allow_origins=["*"]),
+		Middleware(SessionMiddleware, secret_key=os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')),
+	],
+	exception_handlers={ApiError: _api_error},
+	lifespan=lifespan,
+)
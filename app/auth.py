@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import bcrypt
 import streamlit as st
 
 from app.database import create_user, get_user_hash
+from app.passwords import hash_password, check_password
 
 
 SESSION_USER_KEY = "savemax_user"
@@ -18,18 +18,14 @@ def logout() -> None:
 
 
 def signup(username: str, password: str) -> bool:
-	password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
-	return create_user(username, password_hash)
+	return create_user(username, hash_password(password))
 
 
 def login(username: str, password: str) -> bool:
 	saved_hash = get_user_hash(username)
 	if not saved_hash:
 		return False
-	try:
-		if bcrypt.checkpw(password.encode("utf-8"), saved_hash):
-			st.session_state[SESSION_USER_KEY] = username
-			return True
-		return False
-	except Exception:
-		return False 
\ No newline at end of file
+	if check_password(password, saved_hash):
+		st.session_state[SESSION_USER_KEY] = username
+		return True
+	return False 
\ No newline at end of file
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Dict, Mapping
 
 STANDARD_DEDUCTION_NEW = 50000  # FY24-25
 CESS_RATE = 0.04
@@ -15,6 +16,19 @@ class TaxInputs:
 	hra: float = 0.0
 	other_deductions: float = 0.0
 
+	@classmethod
+	def from_mapping(cls, data: Mapping[str, Any]) -> "TaxInputs":
+		"""Build inputs from a JSON-style mapping; missing fields default to 0.
+		Raises ValueError/TypeError for negative, non-finite or non-numeric values.
+		"""
+		values: Dict[str, float] = {}
+		for field in ("annual_income", "deduction_80c", "deduction_80d", "hra", "other_deductions"):
+			value = float(data.get(field) or 0)
+			if not math.isfinite(value) or value < 0:
+				raise ValueError(f"{field} must be a finite, non-negative number")
+			values[field] = value
+		return cls(**values)
+
 	@property
 	def total_deductions_old(self) -> float:
 		return max(0.0, self.deduction_80c + self.deduction_80d + self.hra + self.other_deductions)
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional, Iterable
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DATA_DIR = Path(os.environ.get("SAVEMAX_DATA_DIR", Path(__file__).resolve().parent.parent / "data"))
 USERS_DB = DATA_DIR / "savemax_users.db"
 HISTORY_DB = DATA_DIR / "savemax_history.db"
 
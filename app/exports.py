@@ -1,20 +1,52 @@
 from __future__ import annotations
 
 from io import BytesIO
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 
 import pandas as pd
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 
+from app.calculator import TaxInputs
+from app.formatting import format_inr, format_inr_array
 
-def export_csv(rows: List[Dict]) -> bytes:
+
+def comparison_rows(old_res: Dict[str, float], new_res: Dict[str, float]) -> List[Dict]:
+	return [
+		{"Metric": "Gross Income", "Old": old_res["gross_income"], "New": new_res["gross_income"]},
+		{"Metric": "Taxable Income", "Old": old_res["taxable_income"], "New": new_res["taxable_income"]},
+		{"Metric": "Tax Payable", "Old": old_res["tax"], "New": new_res["tax"]},
+	]
+
+
+def report_summary(chosen_regime: str, inputs: TaxInputs, old_res: Dict[str, float], new_res: Dict[str, float]) -> Dict[str, str]:
+	return {
+		"Preferred Regime": chosen_regime,
+		"Gross Income": format_inr(inputs.annual_income, decimals=0),
+		"Total Deductions (Old)": format_inr(inputs.total_deductions_old, decimals=0),
+		"Tax Old": format_inr(old_res["tax"], decimals=0),
+		"Tax New": format_inr(new_res["tax"], decimals=0),
+	}
+
+
+def _format_money_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+	# One vectorized pass per column instead of formatting cell by cell
+	return df.assign(**{col: format_inr_array(df[col], decimals=0) for col in columns if col in df})
+
+
+def _money_columns(df: pd.DataFrame) -> Iterable[str]:
+	return df.select_dtypes(include="number").columns
+
+
+def export_csv(rows: List[Dict], money_columns: Optional[Iterable[str]] = None) -> bytes:
+	"""Numeric columns are written as ₹ amounts unless `money_columns` names them explicitly."""
 	df = pd.DataFrame(rows)
+	df = _format_money_columns(df, _money_columns(df) if money_columns is None else money_columns)
 	return df.to_csv(index=False).encode("utf-8")
 
 
-def export_pdf(summary: Dict[str, str], comparison_rows: List[Dict[str, str]]) -> bytes:
+def export_pdf(summary: Dict[str, str], rows: List[Dict]) -> bytes:
 	buffer = BytesIO()
 	c = canvas.Canvas(buffer, pagesize=A4)
 	width, height = A4
@@ -36,7 +68,8 @@ def export_pdf(summary: Dict[str, str], comparison_rows: List[Dict[str, str]]) -
 	y -= 8 * mm
 	c.setFont("Helvetica", 10)
 
-	for row in comparison_rows:
+	df = pd.DataFrame(rows)
+	for row in _format_money_columns(df, _money_columns(df)).to_dict("records"):
 		line = ", ".join(f"{k}: {v}" for k, v in row.items())
 		c.drawString(margin, y, line)
 		y -= 6 * mm
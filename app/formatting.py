@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+RUPEE = "₹"
+LAKH = 100_000
+CRORE = 10_000_000
+
+# int64 holds |x| < 2**63; larger amounts take the pure-Python path
+_VECTOR_LIMIT = 1e18
+# Below this many values the per-call NumPy setup costs more than formatting one by one
+_VECTOR_MIN_SIZE = 32
+
+_ZERO = ord("0")
+_COMMA = ord(",")
+_POINT = ord(".")
+
+
+def _comma_count(ndigits: np.ndarray) -> np.ndarray:
+	# Indian grouping: one comma after the last three digits, then one every two
+	return np.where(ndigits > 3, (ndigits - 2) // 2, 0)
+
+
+def _group_layout(max_digits: int) -> np.ndarray:
+	"""Right-aligned slot template: digit position from the right, or -1 for a comma."""
+	slots = []
+	for k in range(max_digits):
+		if k == 3 or (k > 3 and k % 2 == 1):
+			slots.append(-1)
+		slots.append(k)
+	return np.array(slots[::-1], dtype=np.int64)
+
+
+def _format_abs(units: np.ndarray, frac: np.ndarray, decimals: int) -> np.ndarray:
+	"""Format non-negative integer/fraction parts into grouped strings without a Python-level loop.
+
+	Every value is laid out right-aligned as a matrix of code points, shifted left by its
+	own padding and then reinterpreted as a fixed-width unicode array.
+	"""
+	n = units.size
+	if n == 0:
+		return np.empty(0, dtype="U1")
+	max_digits = len(str(int(units.max())))
+	pow10 = 10 ** np.arange(max_digits, dtype=np.int64)
+	digits = (units[:, None] // pow10) % 10
+	ndigits = np.maximum(1, (units[:, None] >= pow10).sum(axis=1))
+
+	layout = _group_layout(max_digits)
+	chars = np.where(layout >= 0, digits[:, np.maximum(layout, 0)] + _ZERO, _COMMA)
+	if decimals > 0:
+		frac_digits = (frac[:, None] // 10 ** np.arange(decimals - 1, -1, -1, dtype=np.int64)) % 10 + _ZERO
+		chars = np.hstack([chars, np.full((n, 1), _POINT), frac_digits])
+
+	width = chars.shape[1]
+	start = layout.size - (ndigits + _comma_count(ndigits))
+	idx = start[:, None] + np.arange(width)
+	shifted = np.take_along_axis(chars, np.minimum(idx, width - 1), axis=1)
+	shifted[idx >= width] = 0  # trailing NULs are dropped by the unicode view
+	return np.ascontiguousarray(shifted, dtype=np.uint32).view(np.dtype(f"U{width}")).ravel()
+
+
+def _round_parts(magnitude: np.ndarray, decimals: int) -> Tuple[np.ndarray, np.ndarray]:
+	"""Split non-negative values into the integer and fraction digits f"{x:.{decimals}f}" would print."""
+	scale = 10 ** decimals
+	# Round the fraction on its own so large amounts keep their paise
+	whole = np.floor(magnitude)
+	frac_scaled = (magnitude - whole) * scale
+	frac = np.floor(frac_scaled).astype(np.int64)
+	units = whole.astype(np.int64)
+	# Half to even on the last printed digit, like f"{amount:.{decimals}f}"
+	remainder = frac_scaled - frac
+	last_digit = frac if decimals > 0 else units
+	frac += (remainder > 0.5) | ((remainder == 0.5) & (last_digit % 2 == 1))
+	units += frac // scale
+	frac %= scale
+	return units, frac
+
+
+def _format_signed(values: np.ndarray, decimals: int, symbol: str) -> np.ndarray:
+	units, frac = _round_parts(np.abs(values), decimals)
+	body = _format_abs(units, frac, decimals)
+	prefix = np.where((values < 0) & ((units > 0) | (frac > 0)), "-" + symbol, symbol)
+	return np.char.add(prefix, body)
+
+
+def _group_digits(digits: str) -> str:
+	"""Indian grouping of a plain digit string: 1234567 -> 12,34,567."""
+	if len(digits) <= 3:
+		return digits
+	head, last3 = digits[:-3], digits[-3:]
+	lead = len(head) % 2
+	groups = ([head[:lead]] if lead else []) + [head[i:i + 2] for i in range(lead, len(head), 2)]
+	return ",".join(groups + [last3])
+
+
+def _format_scalar(amount: float, decimals: int, compact: bool, symbol: str, na_rep: str) -> str:
+	if not math.isfinite(amount):
+		return na_rep
+	suffix = ""
+	if compact:
+		magnitude = abs(amount)
+		# Crores once the lakh figure would print as 100.0, so 99,95,000 reads 1.0Cr rather than 100.0L
+		if float(f"{magnitude / LAKH:.1f}") >= 100:
+			amount, decimals, suffix = amount / CRORE, 1, "Cr"
+		elif magnitude >= LAKH:
+			amount, decimals, suffix = amount / LAKH, 1, "L"
+	text = f"{abs(amount):.{decimals}f}"
+	units, _, frac = text.partition(".")
+	sign = "-" if amount < 0 and text.strip("0.") else ""
+	return f"{sign}{symbol}{_group_digits(units)}{'.' + frac if frac else ''}{suffix}"
+
+
+def format_inr_array(
+	values: Any,
+	decimals: int = 2,
+	compact: bool = False,
+	symbol: str = RUPEE,
+	na_rep: str = "",
+) -> Union[np.ndarray, pd.Series]:
+	"""Format many amounts as Indian Rupees with lakh/crore grouping in one vectorized pass.
+
+	Example: [1234567.89, 500] -> ["₹12,34,567.89", "₹500.00"]
+	With compact=True amounts of a lakh or more are shortened to one decimal,
+	e.g. 1234567 -> "₹12.3L" and 12345678 -> "₹1.2Cr"; smaller amounts keep `decimals`.
+	NaN/inf become `na_rep`. A Series comes back as a Series with the same index.
+	"""
+	series = values if isinstance(values, pd.Series) else None
+	arr = np.asarray(values, dtype=np.float64)
+	flat = arr.ravel()
+	if flat.size < _VECTOR_MIN_SIZE:
+		out = np.array([_format_scalar(v, decimals, compact, symbol, na_rep) for v in flat.tolist()], dtype=str)
+		return _wrap(out.reshape(arr.shape), series)
+
+	finite = np.isfinite(flat)
+	vector = finite & (np.abs(np.where(finite, flat, 0.0)) < _VECTOR_LIMIT)
+	clean = np.where(vector, flat, 0.0)
+
+	pieces = []
+	if compact and vector.any():
+		# Crores once the lakh figure would print as 100.0, matching _format_scalar
+		magnitude = np.abs(clean)
+		lakh_units, _ = _round_parts(magnitude / LAKH, 1)
+		crore = vector & (lakh_units >= 100)
+		lakh = vector & ~crore & (magnitude >= LAKH)
+		short = crore | lakh
+		rest = vector & ~short
+		mantissa = clean[short] / np.where(crore[short], CRORE, LAKH)
+		suffix = np.where(crore[short], "Cr", "L")
+		pieces.append((short, np.char.add(_format_signed(mantissa, 1, symbol), suffix)))
+		pieces.append((rest, _format_signed(clean[rest], decimals, symbol)))
+	elif vector.any():
+		pieces.append((vector, _format_signed(clean[vector], decimals, symbol)))
+	scalar = finite & ~vector
+	if scalar.any():
+		pieces.append((scalar, np.array([_format_scalar(v, decimals, compact, symbol, na_rep) for v in flat[scalar].tolist()], dtype=str)))
+
+	itemsize = max([len(na_rep), 1] + [p.dtype.itemsize // 4 for _, p in pieces])
+	out = np.full(flat.shape, na_rep, dtype=f"U{itemsize}")
+	for mask, formatted in pieces:
+		out[mask] = formatted
+	return _wrap(out.reshape(arr.shape), series)
+
+
+def _wrap(out: np.ndarray, series: Optional[pd.Series]) -> Union[np.ndarray, pd.Series]:
+	if series is not None:
+		return pd.Series(out, index=series.index, name=series.name, dtype=object)
+	return out
+
+
+def format_inr(amount: float, decimals: int = 2, compact: bool = False) -> str:
+	"""Format one number as Indian Rupees with grouping; same output as format_inr_array.
+	Example: 1234567.89 -> ₹12,34,567.89
+	"""
+	return _format_scalar(float(amount), decimals, compact, RUPEE, "")
+
+
+def format_inr_compact(amount: float) -> str:
+	"""Short form for headlines, e.g. 1234567 -> ₹12.3L, 12345678 -> ₹1.2Cr."""
+	return format_inr(amount, decimals=0, compact=True)
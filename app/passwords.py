@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import bcrypt
+
+
+# Kept free of Streamlit so the async app's spawned CPU workers can unpickle these cheaply
+def hash_password(password: str) -> bytes:
+	return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+
+
+def check_password(password: str, saved_hash: bytes) -> bool:
+	try:
+		return bcrypt.checkpw(password.encode("utf-8"), saved_hash)
+	except Exception:
+		return False
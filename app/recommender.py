@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, Tuple
 
 from app.calculator import TaxInputs, calculate_old_regime, calculate_new_regime, STANDARD_DEDUCTION_NEW
+from app.formatting import format_inr
 
 
 def compare_regimes(inputs: TaxInputs) -> Tuple[str, Dict[str, float], Dict[str, float]]:
@@ -34,5 +35,5 @@ def generate_suggestions(inputs: TaxInputs, old_tax: float, new_tax: float) -> l
 	save_delta = abs(old_tax - new_tax)
 	if save_delta > 0:
 		better = "Old" if old_tax < new_tax else "New"
-		suggestions.insert(0, f"Save with SaveMax: {better} Regime saves ₹{save_delta:,.0f} compared to the other.")
+		suggestions.insert(0, f"Save with SaveMax: {better} Regime saves {format_inr(save_delta, decimals=0)} compared to the other.")
 	return suggestions 
\ No newline at end of file
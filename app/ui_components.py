@@ -3,32 +3,7 @@ from __future__ import annotations
 import streamlit as st
 from typing import Dict, Any
 
-RUPEE = "₹"
-
-
-def format_inr(amount: float) -> str:
-	"""Format number as Indian Rupees with grouping.
-	Example: 1234567.89 -> ₹12,34,567.89
-	"""
-	try:
-		integer_part, _, fractional_part = f"{amount:,.2f}".partition(".")
-		# Convert 1,234,567 to 12,34,567 (Indian grouping)
-		parts = integer_part.split(",")
-		if len(parts) <= 3:
-			indian_grouped = integer_part
-		else:
-			head = parts[0]
-			tail = "".join(parts[1:])
-			first = tail[:-6]
-			last6 = tail[-6:]
-			grp = []
-			while len(first) > 0:
-				grp.append(first[-2:])
-				first = first[:-2]
-			indian_grouped = head + "," + ",".join(reversed(grp)) + "," + last6[:3] + "," + last6[3:]
-		return f"{RUPEE}{indian_grouped}.{fractional_part}"
-	except Exception:
-		return f"{RUPEE}{amount:,.2f}"
+from app.formatting import RUPEE, format_inr, format_inr_array, format_inr_compact
 
 
 def gradient_header(title: str, subtitle: str | None = None, logo_path: str | None = None) -> None:
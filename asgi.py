@@ -0,0 +1,5 @@
+from app.async_app import app
+
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run(app) 
\ No newline at end of file
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Concurrent load generator for the SaveMax Flask API.
+
+Each virtual user repeatedly runs the scripted journey
+signup -> login -> compare -> save -> history -> export (PDF)
+against a running server and the per-route latency, throughput and error
+rates are written out as JSON. Only the standard library is used.
+
+Example:
+    SAVEMAX_DATA_DIR=/tmp/savemax-load gunicorn -w 4 --threads 4 -b 127.0.0.1:8000 wsgi:app
+    python loadtest.py --base-url http://127.0.0.1:8000 --users 20 --duration 60 --output report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from http.cookiejar import CookieJar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib import error, request
+
+
+# (route label, method, path) in the order a user walks through them
+JOURNEY = [
+	("signup", "POST", "/api/signup"),
+	("login", "POST", "/api/login"),
+	("compare", "POST", "/api/compare"),
+	("save", "POST", "/api/history"),
+	("history", "GET", "/api/history"),
+	("export", "POST", "/api/export/pdf"),
+]
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+	"""Linear-interpolated percentile of an already sorted sequence."""
+	if not sorted_values:
+		return 0.0
+	rank = (len(sorted_values) - 1) * pct / 100.0
+	lo = math.floor(rank)
+	hi = math.ceil(rank)
+	if lo == hi:
+		return float(sorted_values[lo])
+	return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (rank - lo)
+
+
+class Recorder:
+	"""Thread-safe sink for (route, latency, status) samples."""
+
+	def __init__(self) -> None:
+		self._lock = threading.Lock()
+		self.samples: List[Tuple[str, float, str]] = []
+
+	def record(self, route: str, latency_s: float, status: str) -> None:
+		with self._lock:
+			self.samples.append((route, latency_s, status))
+
+
+def summarize(samples: Sequence[Tuple[str, float, str]], elapsed_s: float) -> Dict[str, Any]:
+	"""Aggregate raw samples into per-route and overall statistics.
+
+	A sample counts as an error when its status is not a 2xx code
+	(HTTP errors, timeouts and connection failures alike).
+	"""
+	def _stats(group: Sequence[Tuple[str, float, str]]) -> Dict[str, Any]:
+		latencies = sorted(s[1] * 1000.0 for s in group)
+		statuses: Dict[str, int] = {}
+		for _, _, status in group:
+			statuses[status] = statuses.get(status, 0) + 1
+		errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+		return {
+			"requests": len(group),
+			"errors": errors,
+			"error_rate": round(errors / len(group), 4) if group else 0.0,
+			"throughput_rps": round(len(group) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+			"latency_ms": {
+				"p50": round(percentile(latencies, 50), 2),
+				"p95": round(percentile(latencies, 95), 2),
+				"p99": round(percentile(latencies, 99), 2),
+				"mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+				"max": round(latencies[-1], 2) if latencies else 0.0,
+			},
+			"status_counts": dict(sorted(statuses.items())),
+		}
+
+	routes: Dict[str, Any] = {}
+	for route, _, _ in JOURNEY:
+		group = [s for s in samples if s[0] == route]
+		if group:
+			routes[route] = _stats(group)
+	return {"elapsed_s": round(elapsed_s, 3), "overall": _stats(samples), "routes": routes}
+
+
+class Client:
+	"""One virtual user: a urllib opener with its own cookie jar (Flask session)."""
+
+	def __init__(self, base_url: str, timeout: float) -> None:
+		self.base_url = base_url.rstrip("/")
+		self.timeout = timeout
+		self.opener = request.build_opener(request.HTTPCookieProcessor(CookieJar()))
+
+	def call(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> str:
+		data = json.dumps(payload).encode("utf-8") if payload is not None else None
+		req = request.Request(self.base_url + path, data=data, method=method)
+		if data is not None:
+			req.add_header("Content-Type", "application/json")
+		try:
+			with self.opener.open(req, timeout=self.timeout) as resp:
+				resp.read()
+				return str(resp.status)
+		except error.HTTPError as exc:
+			try:
+				exc.read()
+			except (HTTPException, OSError):
+				pass
+			return str(exc.code)
+		except (error.URLError, OSError) as exc:
+			reason = getattr(exc, "reason", exc)
+			return "timeout" if isinstance(reason, TimeoutError) else "connection_error"
+		except HTTPException:
+			# IncompleteRead, BadStatusLine, ...: the server answered but broke off mid-response
+			return "protocol_error"
+
+
+def _journey_payloads(rng: random.Random, username: str, password: str) -> Dict[str, Optional[Dict[str, Any]]]:
+	inputs = {
+		"annual_income": rng.randrange(300000, 5000000, 10000),
+		"deduction_80c": rng.randrange(0, 150001, 5000),
+		"deduction_80d": rng.randrange(0, 50001, 1000),
+		"hra": rng.randrange(0, 300001, 1000),
+		"other_deductions": rng.randrange(0, 100001, 1000),
+	}
+	credentials = {"username": username, "password": password}
+	return {
+		"signup": credentials,
+		"login": credentials,
+		"compare": inputs,
+		"save": inputs,
+		"history": None,
+		"export": inputs,
+	}
+
+
+def run_user(user_id: int, args: argparse.Namespace, recorder: Recorder, run_id: str, deadline: Optional[float]) -> None:
+	rng = random.Random(args.seed + user_id)
+	iteration = 0
+	while True:
+		if deadline is not None and time.perf_counter() >= deadline:
+			return
+		if deadline is None and iteration >= args.iterations:
+			return
+		# A fresh session and account per journey so every iteration exercises signup + login
+		client = Client(args.base_url, args.timeout)
+		payloads = _journey_payloads(rng, f"load-{run_id}-{user_id}-{iteration}", "load-test-password")
+		for route, method, path in JOURNEY:
+			start = time.perf_counter()
+			status = client.call(method, path, payloads[route])
+			recorder.record(route, time.perf_counter() - start, status)
+		iteration += 1
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+	recorder = Recorder()
+	run_id = uuid.uuid4().hex[:8]
+	start = time.perf_counter()
+	deadline = start + args.duration if args.duration else None
+	with ThreadPoolExecutor(max_workers=args.users) as pool:
+		futures = []
+		for user_id in range(args.users):
+			futures.append(pool.submit(run_user, user_id, args, recorder, run_id, deadline))
+			if args.ramp_up and args.users > 1:
+				time.sleep(args.ramp_up / (args.users - 1))
+		for future in futures:
+			future.result()
+	report = summarize(recorder.samples, time.perf_counter() - start)
+	report["config"] = {
+		"base_url": args.base_url,
+		"users": args.users,
+		"iterations": None if args.duration else args.iterations,
+		"duration_s": args.duration,
+		"ramp_up_s": args.ramp_up,
+		"timeout_s": args.timeout,
+		"label": args.label,
+	}
+	return report
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+	parser = argparse.ArgumentParser(description="Load-test the SaveMax API with scripted user journeys.")
+	parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="server to target")
+	parser.add_argument("--users", type=int, default=10, help="concurrent virtual users")
+	parser.add_argument("--iterations", type=int, default=5, help="journeys per user (ignored with --duration)")
+	parser.add_argument("--duration", type=float, default=0.0, help="run for this many seconds instead of a fixed iteration count")
+	parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds over which to start the users")
+	parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+	parser.add_argument("--seed", type=int, default=0, help="seed for the generated tax inputs")
+	parser.add_argument("--label", default="", help="free-form tag stored in the report, e.g. 'gunicorn -w4 --threads 4'")
+	parser.add_argument("--output", help="write the JSON report here instead of stdout")
+	parser.add_argument("--max-error-rate", type=float, help="exit non-zero if the overall error rate exceeds this fraction")
+	args = parser.parse_args(argv)
+	if args.users < 1:
+		parser.error("--users must be at least 1")
+	return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+	args = _parse_args(argv)
+	report = run(args)
+	text = json.dumps(report, indent=2)
+	if args.output:
+		with open(args.output, "w", encoding="utf-8") as f:
+			f.write(text + "\n")
+	else:
+		print(text)
+	if args.max_error_rate is not None and report["overall"]["error_rate"] > args.max_error_rate:
+		print(f"error rate {report['overall']['error_rate']:.2%} exceeds {args.max_error_rate:.2%}", file=sys.stderr)
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,24 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app import database
+
+
+class ApiTestCase(unittest.TestCase):
+	"""Points the user/history databases at a fresh temp directory for each test."""
+
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		data_dir = Path(tmp.name)
+		self.patch(database, "DATA_DIR", data_dir)
+		self.patch(database, "USERS_DB", data_dir / "users.db")
+		self.patch(database, "HISTORY_DB", data_dir / "history.db")
+		self.inputs = {"annual_income": 1500000, "deduction_80c": 150000, "deduction_80d": 25000}
+
+	def patch(self, target, name, value):
+		patcher = mock.patch.object(target, name, value)
+		patcher.start()
+		self.addCleanup(patcher.stop)
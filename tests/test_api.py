@@ -0,0 +1,67 @@
+import unittest
+
+from app.app import app
+from api_case import ApiTestCase
+
+
+class TestApi(ApiTestCase):
+	def setUp(self):
+		super().setUp()
+		self.client = app.test_client()
+
+	def test_signup_and_login(self):
+		creds = {"username": "asha", "password": "secret"}
+		self.assertEqual(self.client.post("/api/signup", json=creds).status_code, 201)
+		self.assertEqual(self.client.post("/api/signup", json=creds).status_code, 409)
+		self.assertEqual(self.client.post("/api/signup", json={"username": "asha"}).status_code, 400)
+		self.assertEqual(self.client.post("/api/signup", json={"username": "long", "password": "a" * 100}).status_code, 400)
+		self.assertEqual(self.client.post("/api/login", json={"username": "asha", "password": "é" * 40}).status_code, 400)
+		self.assertEqual(self.client.post("/api/login", json={"username": "asha", "password": "wrong"}).status_code, 401)
+		self.assertEqual(self.client.post("/api/login", json={"username": "nobody", "password": "secret"}).status_code, 401)
+		resp = self.client.post("/api/login", json=creds)
+		self.assertEqual(resp.status_code, 200)
+		self.assertEqual(resp.get_json(), {"username": "asha"})
+
+	def test_history_requires_session(self):
+		self.assertEqual(self.client.get("/api/history").status_code, 401)
+		self.assertEqual(self.client.post("/api/history", json=self.inputs).status_code, 401)
+		creds = {"username": "ravi", "password": "secret"}
+		self.client.post("/api/signup", json=creds)
+		self.client.post("/api/login", json=creds)
+		resp = self.client.post("/api/history", json=dict(self.inputs, regime="Old Regime"))
+		self.assertEqual(resp.status_code, 201)
+		self.assertEqual(self.client.post("/api/history", json=dict(self.inputs, regime="Other")).status_code, 400)
+		history = self.client.get("/api/history").get_json()
+		self.assertEqual(len(history), 1)
+		for _ in range(11):
+			self.client.post("/api/history", json=self.inputs)
+		for limit in ("-1", "0", "1000000", "abc"):
+			self.assertEqual(len(self.client.get(f"/api/history?limit={limit}").get_json()), 10, limit)
+		self.assertEqual(len(self.client.get("/api/history?limit=3").get_json()), 3)
+		self.assertEqual(history[0]["regime"], "Old Regime")
+		self.assertEqual(history[0]["income"], 1500000)
+
+	def test_compare_and_export(self):
+		resp = self.client.post("/api/compare", json=self.inputs)
+		self.assertEqual(resp.status_code, 200)
+		self.assertIn(resp.get_json()["preferred"], ("Old Regime", "New Regime"))
+		pdf = self.client.post("/api/export/pdf", json=self.inputs)
+		self.assertEqual(pdf.status_code, 200)
+		self.assertTrue(pdf.data.startswith(b"%PDF"))
+		csv = self.client.post("/api/export/csv", json=self.inputs)
+		self.assertEqual(csv.mimetype, "text/csv")
+		self.assertIn('Gross Income,"₹15,00,000","₹15,00,000"', csv.get_data(as_text=True))
+		self.assertEqual(self.client.post("/api/export/xls", json=self.inputs).status_code, 404)
+
+	def test_invalid_inputs(self):
+		for body in ([1, 2], "text", 5):
+			self.assertEqual(self.client.post("/api/compare", json=body).status_code, 400)
+			self.assertEqual(self.client.post("/api/signup", json=body).status_code, 400)
+		for bad in ("nan", "inf", -1000, "abc", [1]):
+			resp = self.client.post("/api/compare", json={"annual_income": bad})
+			self.assertEqual(resp.status_code, 400, bad)
+			self.assertEqual(self.client.post("/api/export/pdf", json={"hra": bad}).status_code, 400)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from starlette.testclient import TestClient
+
+from app import async_app
+from api_case import ApiTestCase
+
+
+class TestAsyncApi(ApiTestCase):
+	def setUp(self):
+		super().setUp()
+		# One spawned worker is enough here and keeps start-up quick
+		self.patch(async_app, "CPU_WORKERS", 1)
+
+	def test_journey(self):
+		creds = {"username": "meera", "password": "secret"}
+		with TestClient(async_app.app) as client:
+			self.assertEqual(client.post("/api/signup", json=creds).status_code, 201)
+			self.assertEqual(client.post("/api/signup", json=creds).status_code, 409)
+			self.assertEqual(client.post("/api/login", json=dict(creds, password="wrong")).status_code, 401)
+
+			self.assertEqual(client.get("/api/history").status_code, 401)
+			self.assertEqual(client.post("/api/login", json=creds).status_code, 200)
+			self.assertEqual(client.post("/api/history", json=dict(self.inputs, regime="New Regime")).status_code, 201)
+			history = client.get("/api/history").json()
+			self.assertEqual([row["regime"] for row in history], ["New Regime"])
+
+			pdf = client.post("/api/export/pdf", json=self.inputs)
+			self.assertEqual(pdf.status_code, 200)
+			self.assertEqual(pdf.headers["content-type"], "application/pdf")
+			self.assertTrue(pdf.content.startswith(b"%PDF"))
+
+	def test_invalid_bodies(self):
+		with TestClient(async_app.app) as client:
+			for body in ([1], "text", 5):
+				self.assertEqual(client.post("/api/compare", json=body).status_code, 400)
+				self.assertEqual(client.post("/api/signup", json=body).status_code, 400)
+			self.assertEqual(client.post("/api/compare", content=b"{not json").status_code, 400)
+			self.assertEqual(client.post("/api/compare", json={"annual_income": "nan"}).status_code, 400)
+			self.assertEqual(client.post("/api/export/xls", json=self.inputs).status_code, 404)
+			csv = client.post("/api/export/csv", json=self.inputs)
+			self.assertIn('Gross Income,"₹15,00,000","₹15,00,000"', csv.text)
+			resp = client.post("/api/compare", json=self.inputs)
+			self.assertEqual(resp.status_code, 200)
+			self.assertIn(resp.json()["preferred"], ("Old Regime", "New Regime"))
+
+
+if __name__ == "__main__":
+	unittest.main()
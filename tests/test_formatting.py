@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from app.formatting import format_inr, format_inr_array, format_inr_compact
+
+
+class TestFormatting(unittest.TestCase):
+	def test_indian_grouping(self):
+		self.assertEqual(format_inr(0), "₹0.00")
+		self.assertEqual(format_inr(999), "₹999.00")
+		self.assertEqual(format_inr(1000), "₹1,000.00")
+		self.assertEqual(format_inr(100000), "₹1,00,000.00")
+		self.assertEqual(format_inr(1234567.89), "₹12,34,567.89")
+		self.assertEqual(format_inr(1000000000), "₹1,00,00,00,000.00")
+		self.assertEqual(format_inr(-1234567.891), "-₹12,34,567.89")
+		self.assertEqual(format_inr(99.999, decimals=0), "₹100")
+
+	def test_compact(self):
+		self.assertEqual(format_inr_compact(45000), "₹45,000")
+		self.assertEqual(format_inr_compact(1234567), "₹12.3L")
+		self.assertEqual(format_inr_compact(12345678), "₹1.2Cr")
+		self.assertEqual(format_inr_compact(9999999), "₹1.0Cr")
+		self.assertEqual(format_inr_compact(9500000), "₹95.0L")
+		self.assertEqual(format_inr_compact(9600000), "₹96.0L")
+		self.assertEqual(format_inr_compact(9994999), "₹99.9L")
+		self.assertEqual(format_inr_compact(9995000), "₹1.0Cr")
+		self.assertEqual(format_inr_compact(9999949), "₹1.0Cr")
+		self.assertEqual(format_inr_compact(-2500000), "-₹25.0L")
+		self.assertEqual(format_inr_compact(95000), "₹95,000")
+		self.assertEqual(format_inr_compact(99999), "₹99,999")
+		self.assertEqual(format_inr_compact(100000), "₹1.0L")
+
+	def test_beyond_int64(self):
+		self.assertEqual(format_inr(9.3e18, decimals=0), "₹93,00,00,00,00,00,00,00,000")
+		values = np.full(100, 9.3e18)
+		self.assertTrue((format_inr_array(values, decimals=0) == "₹93,00,00,00,00,00,00,00,000").all())
+
+	def test_scalar_matches_array(self):
+		rng = np.random.default_rng(1)
+		values = np.concatenate([
+			rng.random(2000) * 1e9,
+			-rng.random(200) * 1e6,
+			rng.integers(0, 10**6, 200) + 0.5,
+			[0.0, -0.001, 95000, 99999.6, 9500000, 9600000, 9994999, 9995000, 9999949, 9999999, 99999999.95, 1e17, 2e19],
+			rng.integers(9000000, 10100000, 500),
+		])
+		for decimals in (0, 1, 2):
+			for compact in (False, True):
+				formatted = format_inr_array(values, decimals=decimals, compact=compact)
+				for value, text in zip(values.tolist(), formatted):
+					self.assertEqual(text, format_inr(value, decimals=decimals, compact=compact), (value, decimals, compact))
+
+	def test_array_matches_scalar(self):
+		values = np.random.default_rng(0).random(1000) * 1e9
+		formatted = format_inr_array(values)
+		for value, text in zip(values, formatted):
+			self.assertEqual(text.replace(",", "").replace("₹", ""), f"{value:.2f}")
+
+	def test_series_and_missing_values(self):
+		series = pd.Series([100000, np.nan, 3.5], index=["a", "b", "c"], name="tax")
+		formatted = format_inr_array(series, decimals=0, na_rep="-")
+		self.assertEqual(list(formatted.index), ["a", "b", "c"])
+		self.assertEqual(formatted.name, "tax")
+		self.assertEqual(list(formatted), ["₹1,00,000", "-", "₹4"])
+		self.assertEqual(format_inr_array([]).size, 0)
+
+
+if __name__ == "__main__":
+	unittest.main()
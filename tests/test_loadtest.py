@@ -0,0 +1,62 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from loadtest import Client, percentile, summarize
+
+
+class _TruncatingHandler(BaseHTTPRequestHandler):
+	"""Promises a longer body than it sends, like an overloaded server dropping the connection."""
+
+	def do_GET(self):
+		self.send_response(200 if self.path == "/ok" else 500)
+		self.send_header("Content-Length", "100")
+		self.end_headers()
+		self.wfile.write(b"partial")
+		self.close_connection = True
+
+	def log_message(self, *args):
+		pass
+
+
+class TestLoadtest(unittest.TestCase):
+	def test_percentile(self):
+		values = [10.0, 20.0, 30.0, 40.0]
+		self.assertEqual(percentile(values, 0), 10.0)
+		self.assertEqual(percentile(values, 100), 40.0)
+		self.assertAlmostEqual(percentile(values, 50), 25.0)
+		self.assertEqual(percentile([], 95), 0.0)
+
+	def test_summarize(self):
+		samples = [
+			("login", 0.100, "200"),
+			("login", 0.300, "401"),
+			("export", 0.050, "200"),
+			("export", 0.070, "timeout"),
+		]
+		report = summarize(samples, elapsed_s=2.0)
+		self.assertEqual(report["overall"]["requests"], 4)
+		self.assertEqual(report["overall"]["errors"], 2)
+		self.assertEqual(report["routes"]["login"]["error_rate"], 0.5)
+		self.assertEqual(report["routes"]["login"]["throughput_rps"], 1.0)
+		self.assertAlmostEqual(report["routes"]["login"]["latency_ms"]["p50"], 200.0)
+		self.assertEqual(report["routes"]["export"]["status_counts"], {"200": 1, "timeout": 1})
+		self.assertNotIn("signup", report["routes"])
+
+
+	def test_client_records_broken_responses(self):
+		server = HTTPServer(("127.0.0.1", 0), _TruncatingHandler)
+		thread = threading.Thread(target=server.serve_forever, daemon=True)
+		thread.start()
+		try:
+			client = Client(f"http://127.0.0.1:{server.server_port}", timeout=5)
+			self.assertEqual(client.call("GET", "/ok"), "protocol_error")
+			self.assertEqual(client.call("GET", "/fail"), "500")
+		finally:
+			server.shutdown()
+			server.server_close()
+		self.assertEqual(Client("http://127.0.0.1:1", timeout=1).call("GET", "/"), "connection_error")
+
+
+if __name__ == "__main__":
+	unittest.main()